@@ -8,6 +8,7 @@
  * - K-line: Fast stochastic
  * - D-line: Smoothed K-line
  * - J-line: 3*K - 2*D (leading indicator)
+ * - K/D crossover flags from the previous K-D spread
  * - Rolling window for high/low tracking
  * - O(1) updates after warmup
  */
@@ -30,12 +31,16 @@ class KDJIndicator {
     this.k = null;
     this.d = null;
     this.j = null;
+
+    this.prevSpread = null;
+    this.kCrossedAboveD = false;
+    this.kCrossedBelowD = false;
   }
 
   /**
    * Update KDJ with new candle
    * @param {Object} candle - Candle data { close, open, high, low, time }
-   * @returns {Object|null} - KDJ data { k, d, j } or null if not ready
+   * @returns {Object|null} - KDJ data { k, d, j, kCrossedAboveD, kCrossedBelowD } or null if not ready
    */
   update(candle) {
     this.highs.push(candle.high);
@@ -54,8 +59,12 @@ class KDJIndicator {
       return null;
     }
 
-    const highestHigh = Math.max(...this.highs);
-    const lowestLow = Math.min(...this.lows);
+    let highestHigh = -Infinity;
+    let lowestLow = Infinity;
+    for (let i = 0; i < this.highs.length; i++) {
+      highestHigh = Math.max(highestHigh, this.highs[i]);
+      lowestLow = Math.min(lowestLow, this.lows[i]);
+    }
     const close = candle.close;
 
     // Calculate raw stochastic %K (RSV - Raw Stochastic Value)
@@ -81,7 +90,7 @@ class KDJIndicator {
     if (this.d === null) {
       this.d = this.k;
       this.j = 3 * this.k - 2 * this.d;
-      return { k: this.k, d: this.d, j: this.j };
+      return this.getValue();
     }
 
     // D = SMA of K (exponential moving average for smoothness)
@@ -91,11 +100,15 @@ class KDJIndicator {
     // J = 3*K - 2*D (leading indicator)
     this.j = 3 * this.k - 2 * this.d;
 
-    return {
-      k: this.k,
-      d: this.d,
-      j: this.j
-    };
+    // Crossovers compare against the spread from the previous D update;
+    // the seeding bar forces K == D, so it is not a usable reference
+    const spread = this.k - this.d;
+    const prevSpread = this.prevSpread;
+    this.kCrossedAboveD = prevSpread !== null && prevSpread <= 0 && spread > 0;
+    this.kCrossedBelowD = prevSpread !== null && prevSpread >= 0 && spread < 0;
+    this.prevSpread = spread;
+
+    return this.getValue();
   }
 
   /**
@@ -109,7 +122,9 @@ class KDJIndicator {
     return {
       k: this.k,
       d: this.d,
-      j: this.j
+      j: this.j,
+      kCrossedAboveD: this.kCrossedAboveD,
+      kCrossedBelowD: this.kCrossedBelowD
     };
   }
 
@@ -132,6 +147,9 @@ class KDJIndicator {
     this.k = null;
     this.d = null;
     this.j = null;
+    this.prevSpread = null;
+    this.kCrossedAboveD = false;
+    this.kCrossedBelowD = false;
   }
 
   /**
@@ -149,7 +167,10 @@ class KDJIndicator {
       kValues: [...this.kValues],
       k: this.k,
       d: this.d,
-      j: this.j
+      j: this.j,
+      prevSpread: this.prevSpread,
+      kCrossedAboveD: this.kCrossedAboveD,
+      kCrossedBelowD: this.kCrossedBelowD
     };
   }
 
@@ -168,6 +189,9 @@ class KDJIndicator {
     this.k = state.k;
     this.d = state.d;
     this.j = state.j;
+    this.prevSpread = state.prevSpread !== undefined ? state.prevSpread : null;
+    this.kCrossedAboveD = state.kCrossedAboveD || false;
+    this.kCrossedBelowD = state.kCrossedBelowD || false;
   }
 }
 
@@ -39,8 +39,12 @@ class WilliamsRIndicator {
       return null;
     }
 
-    const highestHigh = Math.max(...this.highs);
-    const lowestLow = Math.min(...this.lows);
+    let highestHigh = -Infinity;
+    let lowestLow = Infinity;
+    for (let i = 0; i < this.highs.length; i++) {
+      highestHigh = Math.max(highestHigh, this.highs[i]);
+      lowestLow = Math.min(lowestLow, this.lows[i]);
+    }
 
     // Handle zero range
     if (highestHigh === lowestLow) {
@@ -5,6 +5,8 @@
  * DOM scoring is LIVE-ONLY and never claimed as backtest-optimized.
  */
 
+const KDJIndicator = require('../../../indicatorEngines/KDJIndicator');
+
 /**
  * Generate signal from indicators using configurable weights
  */
@@ -206,41 +208,27 @@ function scoreDOM(dom, weights) {
 /**
  * Calculate KDJ values from price data
  * 
+ * Replays the prices through the incremental KDJIndicator engine so K and D
+ * are properly smoothed and the K/D crossover flags reflect the last bar.
+ * 
  * @param {Array} prices - Array of prices [high, low, close]
- * @param {Object} config - KDJ configuration
- * @returns {Object} KDJ values
+ * @param {Object} config - KDJ configuration (kPeriod, dPeriod, smooth)
+ * @returns {Object|null} KDJ values, or null until the engine has warmed up
  */
 function calculateKDJ(prices, config) {
-  const { kPeriod = 9 } = config; // Note: other config fields (e.g. dPeriod, smooth) are ignored in this simplified implementation
+  const { kPeriod = 9, dPeriod = 3, smooth = 3 } = config;
   
   if (prices.length < kPeriod) {
     return null;
   }
   
-  // Calculate RSV (Raw Stochastic Value)
-  const recent = prices.slice(-kPeriod);
-  const close = recent[recent.length - 1][2];
-  const high = Math.max(...recent.map(p => p[0]));
-  const low = Math.min(...recent.map(p => p[1]));
-  
-  const rsv = high !== low ? ((close - low) / (high - low)) * 100 : 50;
-  
-  // K = SMA(RSV, smooth)
-  // D = SMA(K, dPeriod)
-  // J = 3*D - 2*K
-  // Simplified calculation (would need full history for accurate SMA)
-  
-  const k = rsv;  // Simplified
-  const d = rsv;  // Simplified
-  const j = 3 * d - 2 * k;
+  const kdj = new KDJIndicator({ kPeriod, dPeriod, smoothK: smooth });
+  let value = null;
+  for (const [high, low, close] of prices) {
+    value = kdj.update({ high, low, close });
+  }
   
-  return {
-    k,
-    d,
-    j,
-    kCrossedAboveD: false,  // Would need previous values
-    kCrossedBelowD: false
-  };
+  return value;
 }
 
 /**
@@ -28,6 +28,7 @@
 require('dotenv').config();
 const express = require('express');
 const http = require('http');
+const https = require('https');
 const path = require('path');
 const WebSocket = require('ws');
 const crypto = require('crypto');
@@ -109,7 +110,9 @@ const CONFIG = {
     RETRY_ATTEMPTS: 3,
     RETRY_DELAY_MS: 1000,
     RATE_LIMIT_DELAY_MS: 5000,
-    REQUEST_TIMEOUT_MS: 10000
+    REQUEST_TIMEOUT_MS: 10000,
+    KEEP_ALIVE_IDLE_TIMEOUT_MS: 5000, // Drop idle pooled sockets before the server does
+    MAX_SOCKETS: 16
   },
   
   // Default symbols
@@ -224,6 +227,7 @@ const TradeMath = {
   calculateNetPnl: DecimalMath.calculateNetPnl.bind(DecimalMath),
   calculateStopLossPrice: DecimalMath.calculateStopLossPrice.bind(DecimalMath),
   calculateTakeProfitPrice: DecimalMath.calculateTakeProfitPrice.bind(DecimalMath),
+  calculateBracketPrices: DecimalMath.calculateBracketPrices.bind(DecimalMath),
   calculateLiquidationPrice: DecimalMath.calculateLiquidationPrice.bind(DecimalMath),
   calculateSlippageAdjustedStop: DecimalMath.calculateSlippageAdjustedStop.bind(DecimalMath),
   calculateTrailingSteps: DecimalMath.calculateTrailingSteps.bind(DecimalMath),
@@ -248,11 +252,26 @@ const TradeMath = {
 // ============================================================================
 // KUCOIN FUTURES API CLASS WITH RETRY LOGIC
 // ============================================================================
+
+// One keep-alive connection pool for all KuCoin REST calls, so polling and
+// order requests reuse TLS connections instead of handshaking every time.
+// Idle sockets are closed after a short timeout (as Node's own keep-alive
+// global agent does) so we don't reuse ones the server has already dropped
+const kucoinHttp = axios.create({
+  httpsAgent: new https.Agent({
+    keepAlive: true,
+    timeout: CONFIG.API.KEEP_ALIVE_IDLE_TIMEOUT_MS,
+    maxSockets: CONFIG.API.MAX_SOCKETS
+  })
+});
+
 class KuCoinFuturesAPI {
   constructor(apiKey, apiSecret, passphrase) {
     this.apiKey = apiKey;
     this.apiSecret = apiSecret;
     this.passphrase = passphrase;
+    this.passphraseSignature = null;
+    this.http = kucoinHttp;
     this.baseURL = CONFIG.KUCOIN_FUTURES_API;
     this.lastRequestTime = 0;
     this.rateLimitCooldown = false;
@@ -266,13 +285,16 @@ class KuCoinFuturesAPI {
   getHeaders(method, endpoint, body = '') {
     const timestamp = Date.now().toString();
     const signature = this.generateSignature(timestamp, method, endpoint, body);
-    const passphraseSignature = crypto.createHmac('sha256', this.apiSecret).update(this.passphrase).digest('base64');
+    // Signed passphrase is constant for the key, so compute it once
+    if (!this.passphraseSignature) {
+      this.passphraseSignature = crypto.createHmac('sha256', this.apiSecret).update(this.passphrase).digest('base64');
+    }
 
     return {
       'KC-API-KEY': this.apiKey,
       'KC-API-SIGN': signature,
       'KC-API-TIMESTAMP': timestamp,
-      'KC-API-PASSPHRASE': passphraseSignature,
+      'KC-API-PASSPHRASE': this.passphraseSignature,
       'KC-API-KEY-VERSION': '2',
       'Content-Type': 'application/json'
     };
@@ -293,7 +315,7 @@ class KuCoinFuturesAPI {
       const headers = this.getHeaders(method, endpoint, body);
       const url = `${this.baseURL}${endpoint}`;
 
-      const response = await axios({
+      const response = await this.http({
         method,
         url,
         headers,
@@ -316,8 +338,12 @@ class KuCoinFuturesAPI {
     } catch (error) {
       const isRateLimit = error.message.includes('Rate limit') || 
                           error.response?.status === 429;
+      // A reset can arrive after KuCoin accepted the request, so only
+      // resend on it when repeating the call cannot duplicate an order
+      const isIdempotent = method === 'GET' || method === 'DELETE';
       const isRetryable = isRateLimit || 
                           error.code === 'ECONNABORTED' ||
+                          (error.code === 'ECONNRESET' && isIdempotent) ||
                           error.code === 'ETIMEDOUT' ||
                           error.response?.status >= 500;
 
@@ -341,39 +367,39 @@ class KuCoinFuturesAPI {
 
   // Public endpoints (no auth needed)
   async getServerTime() {
-    const response = await axios.get(`${this.baseURL}/api/v1/timestamp`);
+    const response = await this.http.get(`${this.baseURL}/api/v1/timestamp`);
     return response.data;
   }
 
   async getContracts() {
-    const response = await axios.get(`${this.baseURL}/api/v1/contracts/active`);
+    const response = await this.http.get(`${this.baseURL}/api/v1/contracts/active`);
     return response.data;
   }
 
   async getContractDetail(symbol) {
-    const response = await axios.get(`${this.baseURL}/api/v1/contracts/${symbol}`);
+    const response = await this.http.get(`${this.baseURL}/api/v1/contracts/${symbol}`);
     return response.data;
   }
 
   async getTicker(symbol) {
-    const response = await axios.get(`${this.baseURL}/api/v1/ticker?symbol=${symbol}`);
+    const response = await this.http.get(`${this.baseURL}/api/v1/ticker?symbol=${symbol}`);
     return response.data;
   }
 
   async getOrderBook(symbol, depth = 20) {
-    const response = await axios.get(`${this.baseURL}/api/v1/level2/depth${depth}?symbol=${symbol}`);
+    const response = await this.http.get(`${this.baseURL}/api/v1/level2/depth${depth}?symbol=${symbol}`);
     return response.data;
   }
 
   async getKlines(symbol, granularity, from, to) {
-    const response = await axios.get(`${this.baseURL}/api/v1/kline/query`, {
+    const response = await this.http.get(`${this.baseURL}/api/v1/kline/query`, {
       params: { symbol, granularity, from, to }
     });
     return response.data;
   }
 
   async getFundingRate(symbol) {
-    const response = await axios.get(`${this.baseURL}/api/v1/funding-rate/${symbol}/current`);
+    const response = await this.http.get(`${this.baseURL}/api/v1/funding-rate/${symbol}/current`);
     return response.data;
   }
 
@@ -431,7 +457,7 @@ class KuCoinFuturesAPI {
   }
 
   async getPublicWebSocketToken() {
-    const response = await axios.post(`${this.baseURL}/api/v1/bullet-public`);
+    const response = await this.http.post(`${this.baseURL}/api/v1/bullet-public`);
     return response.data;
   }
 }
@@ -623,7 +649,8 @@ class RetryQueueManager {
 
   save() {
     try {
-      fs.writeFileSync(CONFIG.RETRY_QUEUE_FILE, JSON.stringify(this.queue, null, 2));
+      // Compact: only read back by load(), and rewritten on every queue change
+      fs.writeFileSync(CONFIG.RETRY_QUEUE_FILE, JSON.stringify(this.queue));
     } catch (error) {
       console.error('[RETRY SAVE ERROR]', error.message);
     }
@@ -722,32 +749,81 @@ const retryQueueManager = new RetryQueueManager();
 class TechnicalIndicators {
   static calculateSMA(data, period) {
     if (!data || data.length < period) return null;
-    const slice = data.slice(-period);
-    return slice.reduce((sum, val) => sum + val, 0) / period;
+    let sum = 0;
+    for (let i = data.length - period; i < data.length; i++) {
+      sum += data[i];
+    }
+    return sum / period;
   }
 
   static calculateEMA(data, period) {
     if (!data || data.length < period) return null;
     const multiplier = 2 / (period + 1);
-    let ema = this.calculateSMA(data.slice(0, period), period);
-    if (ema === null) return null;
-    
+
+    // Seed with the SMA of the first `period` values, read in place
+    let ema = 0;
+    for (let i = 0; i < period; i++) {
+      ema += data[i];
+    }
+    ema /= period;
+
     for (let i = period; i < data.length; i++) {
       ema = (data[i] - ema) * multiplier + ema;
     }
     return ema;
   }
 
+  /**
+   * Two EMAs over the same series in one pass (e.g. MACD fast/slow).
+   * Each EMA is seeded with the SMA of its first `period` values, exactly
+   * like calculateEMA, so results match two separate calls.
+   */
+  static calculateDualEMA(data, fastPeriod, slowPeriod) {
+    if (!data) return { fast: null, slow: null };
+
+    const fastMultiplier = 2 / (fastPeriod + 1);
+    const slowMultiplier = 2 / (slowPeriod + 1);
+    let fast = 0;
+    let slow = 0;
+
+    for (let i = 0; i < data.length; i++) {
+      const value = data[i];
+
+      if (i < fastPeriod) {
+        fast += value;
+        if (i === fastPeriod - 1) fast /= fastPeriod;
+      } else {
+        fast = (value - fast) * fastMultiplier + fast;
+      }
+
+      if (i < slowPeriod) {
+        slow += value;
+        if (i === slowPeriod - 1) slow /= slowPeriod;
+      } else {
+        slow = (value - slow) * slowMultiplier + slow;
+      }
+    }
+
+    return {
+      fast: data.length >= fastPeriod ? fast : null,
+      slow: data.length >= slowPeriod ? slow : null
+    };
+  }
+
   static calculateRSI(data, period = 14) {
     if (!data || data.length < period + 1) return 50;
     
     let gains = 0;
     let losses = 0;
+    let prev = data[data.length - period - 1];
     
+    // One difference per bar, split by sign (no second diff or abs pass)
     for (let i = data.length - period; i < data.length; i++) {
-      const change = data[i] - data[i - 1];
+      const value = data[i];
+      const change = value - prev;
       if (change > 0) gains += change;
-      else losses += Math.abs(change);
+      else losses -= change;
+      prev = value;
     }
     
     const avgGain = gains / period;
@@ -758,16 +834,27 @@ class TechnicalIndicators {
     return 100 - (100 / (1 + rs));
   }
 
-  static calculateWilliamsR(highs, lows, closes, period = 14) {
+  /**
+   * Highest high and lowest low over the trailing window in a single pass.
+   * Williams %R and Stochastic share this range, so callers that need both
+   * can compute it once and pass it through.
+   */
+  static calculateHighLow(highs, lows, period = 14) {
+    let highestHigh = -Infinity;
+    let lowestLow = Infinity;
+    for (let i = highs.length - period; i < highs.length; i++) {
+      highestHigh = Math.max(highestHigh, highs[i]);
+      lowestLow = Math.min(lowestLow, lows[i]);
+    }
+    return { highestHigh, lowestLow };
+  }
+
+  static calculateWilliamsR(highs, lows, closes, period = 14, range = null) {
     if (!closes || closes.length < period) return -50;
     
-    const recentHighs = highs.slice(-period);
-    const recentLows = lows.slice(-period);
+    const { highestHigh, lowestLow } = range || this.calculateHighLow(highs, lows, period);
     const currentClose = closes[closes.length - 1];
     
-    const highestHigh = Math.max(...recentHighs);
-    const lowestLow = Math.min(...recentLows);
-    
     if (highestHigh === lowestLow) return -50;
     return ((highestHigh - currentClose) / (highestHigh - lowestLow)) * -100;
   }
@@ -775,24 +862,25 @@ class TechnicalIndicators {
   static calculateATR(highs, lows, closes, period = 14) {
     if (!closes || closes.length < period + 1) return 0;
     
-    const trueRanges = [];
-    for (let i = 1; i < closes.length; i++) {
-      const tr = Math.max(
+    // Only the last `period` true ranges feed the average, so accumulate
+    // them in place instead of materializing the whole true-range series
+    let sum = 0;
+    for (let i = closes.length - period; i < closes.length; i++) {
+      const prevClose = closes[i - 1];
+      sum += Math.max(
         highs[i] - lows[i],
-        Math.abs(highs[i] - closes[i - 1]),
-        Math.abs(lows[i] - closes[i - 1])
+        Math.abs(highs[i] - prevClose),
+        Math.abs(lows[i] - prevClose)
       );
-      trueRanges.push(tr);
     }
     
-    return this.calculateSMA(trueRanges.slice(-period), period) || 0;
+    return sum / period || 0;
   }
 
   static calculateMACD(data, fastPeriod = 12, slowPeriod = 26, signalPeriod = 9) {
     if (!data || data.length < slowPeriod) return { macd: 0, signal: 0, histogram: 0 };
     
-    const fastEMA = this.calculateEMA(data, fastPeriod);
-    const slowEMA = this.calculateEMA(data, slowPeriod);
+    const { fast: fastEMA, slow: slowEMA } = this.calculateDualEMA(data, fastPeriod, slowPeriod);
     
     if (fastEMA === null || slowEMA === null) return { macd: 0, signal: 0, histogram: 0 };
     
@@ -806,12 +894,19 @@ class TechnicalIndicators {
   static calculateAO(highs, lows, shortPeriod = 5, longPeriod = 34) {
     if (!highs || highs.length < longPeriod) return 0;
     
-    const medianPrices = highs.map((high, i) => (high + lows[i]) / 2);
-    const shortSMA = this.calculateSMA(medianPrices.slice(-shortPeriod), shortPeriod);
-    const longSMA = this.calculateSMA(medianPrices.slice(-longPeriod), longPeriod);
+    // Median prices are only needed for the trailing long window; sum both
+    // SMAs from it in one pass instead of mapping the whole history
+    const end = highs.length;
+    const shortStart = end - shortPeriod;
+    let shortSum = 0;
+    let longSum = 0;
+    for (let i = end - longPeriod; i < end; i++) {
+      const median = (highs[i] + lows[i]) / 2;
+      longSum += median;
+      if (i >= shortStart) shortSum += median;
+    }
     
-    if (shortSMA === null || longSMA === null) return 0;
-    return shortSMA - longSMA;
+    return shortSum / shortPeriod - longSum / longPeriod;
   }
 
   static calculateBollingerBands(data, period = 20, stdDev = 2) {
@@ -820,10 +915,22 @@ class TechnicalIndicators {
       return { upper: lastPrice, middle: lastPrice, lower: lastPrice };
     }
     
-    const slice = data.slice(-period);
-    const sma = slice.reduce((sum, val) => sum + val, 0) / period;
-    const variance = slice.reduce((sum, val) => sum + Math.pow(val - sma, 2), 0) / period;
-    const std = Math.sqrt(variance);
+    // Single pass over the window: plain sum for the basis, Welford's
+    // update for the (population) variance, which stays stable at
+    // large price levels without a second read of the window
+    const start = data.length - period;
+    let sum = 0;
+    let mean = 0;
+    let m2 = 0;
+    for (let i = 0; i < period; i++) {
+      const value = data[start + i];
+      sum += value;
+      const delta = value - mean;
+      mean += delta / (i + 1);
+      m2 += delta * (value - mean);
+    }
+    const sma = sum / period;
+    const std = Math.sqrt(m2 / period);
     
     return {
       upper: sma + (stdDev * std),
@@ -832,16 +939,12 @@ class TechnicalIndicators {
     };
   }
 
-  static calculateStochastic(highs, lows, closes, period = 14, smoothK = 3, smoothD = 3) {
+  static calculateStochastic(highs, lows, closes, period = 14, smoothK = 3, smoothD = 3, range = null) {
     if (!closes || closes.length < period) return { k: 50, d: 50 };
     
-    const recentHighs = highs.slice(-period);
-    const recentLows = lows.slice(-period);
+    const { highestHigh, lowestLow } = range || this.calculateHighLow(highs, lows, period);
     const currentClose = closes[closes.length - 1];
     
-    const highestHigh = Math.max(...recentHighs);
-    const lowestLow = Math.min(...recentLows);
-    
     if (highestHigh === lowestLow) return { k: 50, d: 50 };
     
     const k = ((currentClose - lowestLow) / (highestHigh - lowestLow)) * 100;
@@ -852,9 +955,12 @@ class TechnicalIndicators {
 
   /**
    * V3.5 NEW: Calculate ATR as percentage of price (volatility)
+   * Pass a precomputed ATR to avoid scanning the true ranges a second time
    */
-  static calculateATRPercent(highs, lows, closes, period = 14) {
-    const atr = this.calculateATR(highs, lows, closes, period);
+  static calculateATRPercent(highs, lows, closes, period = 14, atr = null) {
+    if (atr === null) {
+      atr = this.calculateATR(highs, lows, closes, period);
+    }
     const currentPrice = closes[closes.length - 1];
     if (!currentPrice || currentPrice === 0) return 0;
     return (atr / currentPrice) * 100;
@@ -876,6 +982,10 @@ class MarketDataManager {
     this.symbol = symbol;
     this.candles = [];
     this.maxCandles = 500;
+    // Column views of the candle buffer, kept in sync so indicator
+    // calculations don't rebuild them on every call. Backed by preallocated
+    // Float64Arrays; float32 would lose tick precision at BTC price levels.
+    this.allocateColumns(this.maxCandles);
     this.currentPrice = 0;
     this.priceChange24h = 0;
     this.volume24h = 0;
@@ -883,8 +993,39 @@ class MarketDataManager {
     this.bestAsk = 0;
   }
 
+  allocateColumns(capacity) {
+    this.columnBuffers = {
+      close: new Float64Array(capacity),
+      high: new Float64Array(capacity),
+      low: new Float64Array(capacity)
+    };
+    this.setColumnLength(0);
+  }
+
+  setColumnLength(length) {
+    const { close, high, low } = this.columnBuffers;
+    this.closes = close.subarray(0, length);
+    this.highs = high.subarray(0, length);
+    this.lows = low.subarray(0, length);
+    // Column contents changed, so cached indicator values are stale
+    this.indicatorCache = null;
+  }
+
   addCandle(candle) {
     this.candles.push(candle);
+    const { close, high, low } = this.columnBuffers;
+    let length = this.closes.length;
+    if (length === close.length) {
+      // Buffer full: drop the oldest bar in place
+      close.copyWithin(0, 1);
+      high.copyWithin(0, 1);
+      low.copyWithin(0, 1);
+      length--;
+    }
+    close[length] = candle.close;
+    high[length] = candle.high;
+    low[length] = candle.low;
+    this.setColumnLength(length + 1);
     if (this.candles.length > this.maxCandles) {
       this.candles.shift();
     }
@@ -894,14 +1035,43 @@ class MarketDataManager {
   loadCandles(klineData) {
     if (!klineData || !Array.isArray(klineData)) return;
     
-    this.candles = klineData.map(k => ({
-      timestamp: k[0],
-      open: parseFloat(k[1]),
-      high: parseFloat(k[2]),
-      low: parseFloat(k[3]),
-      close: parseFloat(k[4]),
-      volume: parseFloat(k[5])
-    })).sort((a, b) => a.timestamp - b.timestamp);
+    const count = klineData.length;
+    
+    // KuCoin returns klines oldest-first; only build a sort order when a
+    // row is out of sequence, and sort row indices rather than parsed objects
+    let order = null;
+    for (let i = 1; i < count; i++) {
+      if (klineData[i][0] - klineData[i - 1][0] < 0) {
+        order = Array.from({ length: count }, (_, j) => j)
+          .sort((a, b) => klineData[a][0] - klineData[b][0]);
+        break;
+      }
+    }
+    
+    const capacity = Math.max(count, this.maxCandles);
+    if (capacity !== this.columnBuffers.close.length) {
+      this.allocateColumns(capacity);
+    }
+    const { close, high, low } = this.columnBuffers;
+    
+    // Parse each row once, filling the candle list and columns together
+    this.candles = new Array(count);
+    for (let i = 0; i < count; i++) {
+      const k = klineData[order ? order[i] : i];
+      const candle = {
+        timestamp: k[0],
+        open: parseFloat(k[1]),
+        high: parseFloat(k[2]),
+        low: parseFloat(k[3]),
+        close: parseFloat(k[4]),
+        volume: parseFloat(k[5])
+      };
+      this.candles[i] = candle;
+      close[i] = candle.close;
+      high[i] = candle.high;
+      low[i] = candle.low;
+    }
+    this.setColumnLength(count);
     
     if (this.candles.length > 0) {
       this.currentPrice = this.candles[this.candles.length - 1].close;
@@ -938,28 +1108,43 @@ class MarketDataManager {
       };
     }
 
-    const closes = this.candles.map(c => c.close);
-    const highs = this.candles.map(c => c.high);
-    const lows = this.candles.map(c => c.low);
+    // Candle-derived values only change when a candle is added or the
+    // history is reloaded; ticker updates between candles reuse them
+    if (!this.indicatorCache) {
+      this.indicatorCache = this.computeCandleIndicators();
+    }
+    const cached = this.indicatorCache;
+
+    return {
+      price: this.currentPrice,
+      ...cached,
+      ema50: cached.ema50 || this.currentPrice,
+      ema200: cached.ema200 || this.currentPrice
+    };
+  }
+
+  computeCandleIndicators() {
+    const { closes, highs, lows } = this;
 
     const macdData = TechnicalIndicators.calculateMACD(closes);
     const bbData = TechnicalIndicators.calculateBollingerBands(closes);
-    const stochData = TechnicalIndicators.calculateStochastic(highs, lows, closes);
+    const range14 = TechnicalIndicators.calculateHighLow(highs, lows, 14);
+    const stochData = TechnicalIndicators.calculateStochastic(highs, lows, closes, 14, 3, 3, range14);
     const atr = TechnicalIndicators.calculateATR(highs, lows, closes, 14);
-    const atrPercent = TechnicalIndicators.calculateATRPercent(highs, lows, closes, 14);
+    const atrPercent = TechnicalIndicators.calculateATRPercent(highs, lows, closes, 14, atr);
+    const trend = TechnicalIndicators.calculateDualEMA(closes, 50, Math.min(200, closes.length));
 
     return {
-      price: this.currentPrice,
       rsi: TechnicalIndicators.calculateRSI(closes, 14),
-      williamsR: TechnicalIndicators.calculateWilliamsR(highs, lows, closes, 14),
+      williamsR: TechnicalIndicators.calculateWilliamsR(highs, lows, closes, 14, range14),
       atr: atr,
       atrPercent: atrPercent,
       ao: TechnicalIndicators.calculateAO(highs, lows, 5, 34),
       macd: macdData.macd,
       macdSignal: macdData.signal,
       macdHistogram: macdData.histogram,
-      ema50: TechnicalIndicators.calculateEMA(closes, 50) || this.currentPrice,
-      ema200: TechnicalIndicators.calculateEMA(closes, Math.min(200, closes.length)) || this.currentPrice,
+      ema50: trend.fast,
+      ema200: trend.slow,
       bollingerUpper: bbData.upper,
       bollingerMiddle: bbData.middle,
       bollingerLower: bbData.lower,
@@ -968,8 +1153,9 @@ class MarketDataManager {
     };
   }
 
-  generateSignal() {
-    const indicators = this.getIndicators();
+  // Callers that already hold this tick's indicators pass them in to
+  // avoid recomputing every indicator over the full candle history
+  generateSignal(indicators = this.getIndicators()) {
     return SignalGenerator.generate(indicators);
   }
 
@@ -987,8 +1173,7 @@ class MarketDataManager {
   /**
    * V3.5 NEW: Calculate recommended leverage based on ATR volatility
    */
-  getRecommendedLeverage(riskMultiplier = 1.0) {
-    const indicators = this.getIndicators();
+  getRecommendedLeverage(riskMultiplier = 1.0, indicators = this.getIndicators()) {
     return TradeMath.calculateAutoLeverage(indicators.atrPercent, riskMultiplier);
   }
 }
@@ -1504,7 +1689,8 @@ function savePositions() {
     for (const [symbol, manager] of activePositions.entries()) {
       data[symbol] = manager.toJSON();
     }
-    fs.writeFileSync(CONFIG.POSITIONS_FILE, JSON.stringify(data, null, 2));
+    // Compact: rewritten on every stop/TP update and only read back on startup
+    fs.writeFileSync(CONFIG.POSITIONS_FILE, JSON.stringify(data));
   } catch (error) {
     console.error('[SAVE ERROR]', error.message);
   }
@@ -1560,11 +1746,11 @@ function broadcastMarketData(symbol) {
   
   const manager = marketManagers[symbol];
   const indicators = manager.getIndicators();
-  const signal = manager.generateSignal();
+  const signal = manager.generateSignal(indicators);
   const marketData = manager.getMarketData();
   
   // V3.5: Include recommended leverage
-  const recommendedLeverage = manager.getRecommendedLeverage(1.0);
+  const recommendedLeverage = manager.getRecommendedLeverage(1.0, indicators);
   
   broadcast({
     type: 'market_update',
@@ -1610,8 +1796,8 @@ function broadcastInitialState(ws) {
     const manager = marketManagers[symbol];
     marketData[symbol] = manager.getMarketData();
     indicators[symbol] = manager.getIndicators();
-    signals[symbol] = manager.generateSignal();
-    recommendedLeverages[symbol] = manager.getRecommendedLeverage(1.0);
+    signals[symbol] = manager.generateSignal(indicators[symbol]);
+    recommendedLeverages[symbol] = manager.getRecommendedLeverage(1.0, indicators[symbol]);
   });
 
   const positions = [];
@@ -1844,11 +2030,9 @@ async function executeEntry(symbol, side, positionSizePercent = CONFIG.TRADING.P
   
   // Contract size
   const contractValue = entryPrice * specs.multiplier;
-  let size = TradeMath.calculateLotSize(positionValueUSD, entryPrice, specs.multiplier);
-  
-  // Round to lot size
+  // Floored to whole contracts and to the contract's lot size in one step
   const lotSize = specs.lotSize || 1;
-  size = TradeMath.roundToLotSize(size, lotSize);
+  const size = TradeMath.calculateLotSize(positionValueUSD, entryPrice, specs.multiplier, lotSize);
   
   // Calculate actual values after rounding
   const actualPositionValueUSD = size * contractValue;
@@ -1866,8 +2050,9 @@ async function executeEntry(symbol, side, positionSizePercent = CONFIG.TRADING.P
   const slROI = CONFIG.TRADING.INITIAL_SL_ROI;
   const tpROI = CONFIG.TRADING.INITIAL_TP_ROI;
   
-  const stopLoss = TradeMath.calculateStopLossPrice(side, entryPrice, slROI, leverage);
-  const takeProfit = TradeMath.calculateTakeProfitPrice(side, entryPrice, tpROI, leverage);
+  // V3.5: Partial TP (TP1) price is derived alongside SL/TP when enabled
+  const tp1ROI = CONFIG.TRADING.ENABLE_PARTIAL_TP ? CONFIG.TRADING.TP1_ROI : null;
+  const { stopLoss, takeProfit, tp1Price } = TradeMath.calculateBracketPrices(side, entryPrice, slROI, tpROI, leverage, tp1ROI);
   
   // V3.5: Calculate liquidation price
   const maintMargin = specs.maintMargin || CONFIG.TRADING.MAINTENANCE_MARGIN_PERCENT;
@@ -1875,12 +2060,6 @@ async function executeEntry(symbol, side, positionSizePercent = CONFIG.TRADING.P
   
   // V3.5: Calculate fee-adjusted break-even threshold
   const feeAdjustedBreakEven = TradeMath.calculateFeeAdjustedBreakEven(entryFee, exitFee, leverage, CONFIG.TRADING.BREAK_EVEN_BUFFER);
-  
-  // V3.5: Calculate partial TP price if enabled
-  let tp1Price = null;
-  if (CONFIG.TRADING.ENABLE_PARTIAL_TP) {
-    tp1Price = TradeMath.calculateTakeProfitPrice(side, entryPrice, CONFIG.TRADING.TP1_ROI, leverage);
-  }
 
   // Round prices to tick size
   const tickSize = specs.tickSize;
@@ -2198,10 +2377,10 @@ app.get('/api/market/:symbol', (req, res) => {
   res.json({
     marketData: manager.getMarketData(),
     indicators,
-    signal: manager.generateSignal(),
+    signal: manager.generateSignal(indicators),
     orderBook: orderBooks[symbol],
     fundingRate: fundingRates[symbol],
-    recommendedLeverage: manager.getRecommendedLeverage(1.0),
+    recommendedLeverage: manager.getRecommendedLeverage(1.0, indicators),
     tradingConfig: CONFIG.TRADING
   });
 });
@@ -2565,6 +2744,7 @@ if (require.main === module) {
 module.exports = {
   TradeMath,
   TechnicalIndicators,
+  MarketDataManager,
   CONFIG,
   KuCoinFuturesAPI,
   MockKuCoinFuturesAPI,
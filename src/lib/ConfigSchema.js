@@ -27,7 +27,9 @@ const ConfigSchema = {
     RETRY_ATTEMPTS: { type: 'number', min: 1, max: 10, default: 3 },
     RETRY_DELAY_MS: { type: 'number', min: 100, max: 30000, default: 1000 },
     RATE_LIMIT_DELAY_MS: { type: 'number', min: 1000, max: 60000, default: 5000 },
-    REQUEST_TIMEOUT_MS: { type: 'number', min: 1000, max: 60000, default: 10000 }
+    REQUEST_TIMEOUT_MS: { type: 'number', min: 1000, max: 60000, default: 10000 },
+    KEEP_ALIVE_IDLE_TIMEOUT_MS: { type: 'number', min: 1000, max: 60000, default: 5000 },
+    MAX_SOCKETS: { type: 'number', min: 1, max: 256, default: 16 }
   }
 };
 
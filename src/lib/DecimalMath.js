@@ -42,12 +42,18 @@ class DecimalMath {
   /**
    * Calculate contract size (lots)
    * Formula: size = floor(positionValueUSD / (entryPrice × multiplier))
+   * When lotSize is given, the size is also floored to a multiple of it
+   * (same as roundToLotSize) without leaving Decimal in between
    */
-  static calculateLotSize(positionValueUSD, entryPrice, multiplier = 1) {
+  static calculateLotSize(positionValueUSD, entryPrice, multiplier = 1, lotSize = null) {
     const posValue = new Decimal(positionValueUSD);
     const entry = new Decimal(entryPrice);
     const mult = new Decimal(multiplier);
-    const result = posValue.dividedBy(entry.times(mult)).floor();
+    let result = posValue.dividedBy(entry.times(mult)).floor();
+    if (lotSize !== null) {
+      const lotSizeDecimal = new Decimal(lotSize);
+      result = result.dividedBy(lotSizeDecimal).floor().times(lotSizeDecimal);
+    }
     return result.toNumber();
   }
 
@@ -162,6 +168,30 @@ class DecimalMath {
     return result.toNumber();
   }
 
+  /**
+   * Calculate stop loss, take profit and optional TP1 prices for one entry
+   * Same formulas as calculateStopLossPrice / calculateTakeProfitPrice, with
+   * the entry and leverage parsed and the side resolved once for all three
+   * @returns {Object} { stopLoss, takeProfit, tp1Price } (tp1Price null when tp1ROI is null)
+   */
+  static calculateBracketPrices(side, entryPrice, slROI, tpROI, leverage, tp1ROI = null) {
+    const entry = new Decimal(entryPrice);
+    const lev = new Decimal(leverage);
+    const one = new Decimal(1);
+    const pricePercent = roi => new Decimal(roi).dividedBy(lev).dividedBy(100);
+    const below = roi => entry.times(one.minus(pricePercent(roi))).toNumber();
+    const above = roi => entry.times(one.plus(pricePercent(roi))).toNumber();
+
+    // Longs stop below and take profit above the entry; shorts the reverse
+    const [toStop, toTarget] = side === 'long' ? [below, above] : [above, below];
+
+    return {
+      stopLoss: toStop(slROI),
+      takeProfit: toTarget(tpROI),
+      tp1Price: tp1ROI === null ? null : toTarget(tp1ROI)
+    };
+  }
+
   /**
    * Calculate liquidation price with maintenance margin
    * Formula (Long): liqPrice = entry - (entry / leverage × (1 + maintMargin))
@@ -248,11 +278,12 @@ class DecimalMath {
    * Uses ATR percentage to determine safe leverage tier
    */
   static calculateAutoLeverage(atrPercent, riskMultiplier, tiers) {
-    const atr = new Decimal(atrPercent);
+    // Plain number comparison is exact for tier lookup; no Decimal needed
+    const atr = Number(atrPercent);
     
     let baseLeverage = 3; // Default to safest
     for (const tier of tiers) {
-      if (atr.lt(tier.maxVolatility)) {
+      if (atr < tier.maxVolatility) {
         baseLeverage = tier.leverage;
         break;
       }
@@ -260,10 +291,10 @@ class DecimalMath {
     
     // Apply risk multiplier and clamp between 1-100
     const mult = new Decimal(riskMultiplier);
-    const adjustedLeverage = new Decimal(baseLeverage).times(mult).round();
-    const clamped = Decimal.max(1, Decimal.min(100, adjustedLeverage));
+    const adjustedLeverage = new Decimal(baseLeverage).times(mult).round().toNumber();
     
-    return clamped.toNumber();
+    // Rounded to an integer above, so clamping as a number is exact
+    return Math.max(1, Math.min(100, adjustedLeverage));
   }
 
   /**
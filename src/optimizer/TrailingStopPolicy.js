@@ -48,6 +48,10 @@ class TrailingStopPolicy {
     const trailingMovePercent = config.trailingMovePercent || 0.05;
     const trailingMode = config.trailingMode || 'staircase';
 
+    // +1 for long, -1 for short: "favorable" stop moves are up for longs
+    // and down for shorts, so sign * (a - b) > 0 means a is the better stop
+    const sign = side === 'long' ? 1 : -1;
+
     // Calculate fee-adjusted break-even ROI threshold
     const breakEvenROI = DecimalMath.calculateFeeAdjustedBreakEven(
       entryFeeRate,
@@ -63,29 +67,15 @@ class TrailingStopPolicy {
 
     // Step 1: Check if we should move to break-even
     if (!breakEvenArmed && currentROI >= breakEvenROI) {
-      // Move stop to entry price + small buffer (for long) or entry - buffer (for short)
+      // Entry price plus a small buffer on the profitable side
       const bufferPercent = breakEvenBuffer / leverage / 100; // Convert ROI buffer to price percent
-      
-      if (side === 'long') {
-        newStopPrice = entryPrice * (1 + bufferPercent);
-        // Ensure we don't lower the stop
-        if (newStopPrice > currentStop) {
-          newBreakEvenArmed = true;
-          reason = 'break_even';
-        } else {
-          // Keep current stop if it's already better
-          newStopPrice = currentStop;
-        }
-      } else {
-        newStopPrice = entryPrice * (1 - bufferPercent);
-        // Ensure we don't raise the stop (for short)
-        if (newStopPrice < currentStop) {
-          newBreakEvenArmed = true;
-          reason = 'break_even';
-        } else {
-          // Keep current stop if it's already better
-          newStopPrice = currentStop;
-        }
+      const breakEvenStop = entryPrice * (1 + sign * bufferPercent);
+
+      // Keep current stop if it's already better
+      if (sign * (breakEvenStop - currentStop) > 0) {
+        newStopPrice = breakEvenStop;
+        newBreakEvenArmed = true;
+        reason = 'break_even';
       }
     }
     
@@ -97,42 +87,22 @@ class TrailingStopPolicy {
       
       // If we've crossed a new step threshold
       if (currentStep > lastROIStep) {
-        // Move stop closer by trailingMovePercent in favorable direction
+        // Move stop toward current price, keeping trailingMovePercent of the move as room
         const movePercent = trailingMovePercent / 100;
+        const priceMove = entryPrice * (currentROI / leverage / 100);
+        const targetStop = entryPrice + sign * (priceMove * (1 - movePercent));
         
-        if (side === 'long') {
-          // For long, move stop up (toward current price)
-          const priceIncrease = entryPrice * (currentROI / leverage / 100);
-          const targetStop = entryPrice + (priceIncrease * (1 - movePercent));
-          
-          // Only move stop up (never down)
-          if (targetStop > currentStop) {
-            newStopPrice = targetStop;
-            newLastROIStep = currentStep;
-            reason = 'trailing_step';
-          }
-        } else {
-          // For short, move stop down (toward current price)
-          const priceDecrease = entryPrice * (currentROI / leverage / 100);
-          const targetStop = entryPrice - (priceDecrease * (1 - movePercent));
-          
-          // Only move stop down (never up) for short
-          if (targetStop < currentStop) {
-            newStopPrice = targetStop;
-            newLastROIStep = currentStep;
-            reason = 'trailing_step';
-          }
+        // Only ever tighten the stop
+        if (sign * (targetStop - currentStop) > 0) {
+          newStopPrice = targetStop;
+          newLastROIStep = currentStep;
+          reason = 'trailing_step';
         }
       }
     }
 
-    // Validate stop movement is monotonic
-    if (side === 'long' && newStopPrice < currentStop) {
-      // For long, stop should never decrease
-      newStopPrice = currentStop;
-      reason = 'no_change';
-    } else if (side === 'short' && newStopPrice > currentStop) {
-      // For short, stop should never increase
+    // Validate stop movement is monotonic (never loosen the stop)
+    if (sign * (newStopPrice - currentStop) < 0) {
       newStopPrice = currentStop;
       reason = 'no_change';
     }
@@ -0,0 +1,53 @@
+// ============================================================================
+// Extended Signal Generator Tests
+// ============================================================================
+
+const { test, describe } = require('node:test');
+const assert = require('node:assert');
+const { calculateKDJ, scoreKDJ } = require('../research/lib/signals/extended-generator');
+const KDJIndicator = require('../indicatorEngines/KDJIndicator');
+
+// [high, low, close] rows oscillating around 100
+function generatePrices(count) {
+  const prices = [];
+  let close = 100;
+  for (let i = 0; i < count; i++) {
+    close += Math.sin(i / 2) * 3;
+    prices.push([close + 1, close - 1, close]);
+  }
+  return prices;
+}
+
+describe('calculateKDJ', () => {
+  test('returns the KDJIndicator engine value for the last bar', () => {
+    const prices = generatePrices(40);
+    const engine = new KDJIndicator({ kPeriod: 9, dPeriod: 3, smoothK: 3 });
+    let expected = null;
+    for (const [high, low, close] of prices) {
+      expected = engine.update({ high, low, close });
+    }
+
+    assert.deepStrictEqual(calculateKDJ(prices, { kPeriod: 9, dPeriod: 3, smooth: 3 }), expected);
+  });
+
+  test('returns null until the engine has warmed up', () => {
+    assert.strictEqual(calculateKDJ(generatePrices(5), { kPeriod: 9 }), null);
+    assert.strictEqual(calculateKDJ(generatePrices(9), { kPeriod: 9 }), null);
+  });
+
+  test('crossover flags reach scoreKDJ', () => {
+    const prices = generatePrices(40);
+    const weights = { max: 15, jOversold: -Infinity, jOverbought: Infinity, crossWeight: 5 };
+
+    // Find a bar where the engine reports a cross and score it
+    let crossed = null;
+    for (let i = 9; i <= prices.length && !crossed; i++) {
+      const kdj = calculateKDJ(prices.slice(0, i), { kPeriod: 9, dPeriod: 3, smooth: 3 });
+      if (kdj && (kdj.kCrossedAboveD || kdj.kCrossedBelowD)) crossed = kdj;
+    }
+
+    assert.ok(crossed, 'expected at least one K/D cross in an oscillating series');
+    const score = scoreKDJ(crossed, weights);
+    assert.strictEqual(Math.abs(score.contribution), 5);
+  });
+});
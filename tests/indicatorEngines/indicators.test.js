@@ -85,6 +85,15 @@ describe('RSIIndicator', () => {
     });
   });
 
+  it('should surface a NaN close as NaN instead of a flat bar', () => {
+    const rsi = new RSIIndicator({ period: 14 });
+    const candles = generateCandles(20);
+    candles.forEach(candle => rsi.update(candle));
+
+    const value = rsi.update({ ...candles[candles.length - 1], close: NaN });
+    assert.ok(Number.isNaN(value), `expected NaN, got ${value}`);
+  });
+
   it('should support state serialization', () => {
     const rsi1 = new RSIIndicator({ period: 14 });
     const candles = generateCandles(20);
@@ -212,6 +221,42 @@ describe('KDJIndicator', () => {
       }
     });
   });
+
+  it('should flag K/D crossovers', () => {
+    const kdj = new KDJIndicator();
+    const closes = [110, 108, 106, 104, 102, 100, 98, 96, 94, 92, 90, 88, 95, 102, 109];
+    const values = closes.map((close, i) => kdj.update({
+      time: i + 1, open: close, high: close + 1, low: close - 1, close, volume: 1000
+    }));
+
+    // Sustained decline keeps K below D without a bullish cross
+    const declineValues = values.slice(0, 12).filter(v => v !== null);
+    assert.ok(declineValues.every(v => !v.kCrossedAboveD));
+
+    // Sharp reversal pushes K back above D exactly once
+    const crosses = values.filter(v => v !== null && v.kCrossedAboveD);
+    assert.strictEqual(crosses.length, 1);
+    assert.ok(crosses[0].k > crosses[0].d);
+    assert.strictEqual(crosses[0].kCrossedBelowD, false);
+  });
+
+  it('should not flag a crossover on the first bar after D is seeded', () => {
+    const kdj = new KDJIndicator();
+    const closes = [100, 101, 99, 102, 98, 103, 97, 104, 96, 105, 95, 110, 90];
+    const values = closes.map((close, i) => kdj.update({
+      time: i + 1, open: close, high: close + 1, low: close - 1, close, volume: 1000
+    }));
+
+    const readyIndex = values.findIndex(v => v !== null);
+    const seeded = values[readyIndex];
+    const firstUpdate = values[readyIndex + 1];
+
+    // K moves on the bar after seeding, so the spread is non-zero
+    assert.notStrictEqual(firstUpdate.k, seeded.k);
+    assert.notStrictEqual(firstUpdate.k, firstUpdate.d);
+    assert.strictEqual(firstUpdate.kCrossedAboveD, false);
+    assert.strictEqual(firstUpdate.kCrossedBelowD, false);
+  });
 });
 
 describe('OBVIndicator', () => {
@@ -0,0 +1,42 @@
+process.env.DEMO_MODE = 'true';
+process.env.RUN_INTERVALS = 'false';
+
+const { test, describe } = require('node:test');
+const assert = require('node:assert');
+const path = require('path');
+const SignalGenerator = require('../src/lib/SignalGenerator');
+
+// Initialize SignalGenerator before importing server to avoid path issues
+SignalGenerator.initialize(path.resolve(__dirname, '../signal-weights.js'));
+
+const { KuCoinFuturesAPI, CONFIG } = require('../server');
+
+// Client whose transport always fails with the given error code
+function createFailingClient(code) {
+  const api = new KuCoinFuturesAPI('key', 'secret', 'passphrase');
+  api.calls = 0;
+  api.http = async () => {
+    api.calls++;
+    const error = new Error(`socket failure (${code})`);
+    error.code = code;
+    throw error;
+  };
+  api.sleep = async () => {};
+  return api;
+}
+
+describe('KuCoinFuturesAPI retries', () => {
+  test('retries GET requests on ECONNRESET', async () => {
+    const api = createFailingClient('ECONNRESET');
+
+    await assert.rejects(api.request('GET', '/api/v1/positions'));
+    assert.strictEqual(api.calls, 1 + CONFIG.API.RETRY_ATTEMPTS);
+  });
+
+  test('does not resend POST requests on ECONNRESET', async () => {
+    const api = createFailingClient('ECONNRESET');
+
+    await assert.rejects(api.request('POST', '/api/v1/orders', { clientOid: 'abc', side: 'buy' }));
+    assert.strictEqual(api.calls, 1);
+  });
+});
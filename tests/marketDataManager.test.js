@@ -0,0 +1,159 @@
+process.env.DEMO_MODE = 'true';
+process.env.RUN_INTERVALS = 'false';
+
+const { test, describe } = require('node:test');
+const assert = require('node:assert');
+const path = require('path');
+const SignalGenerator = require('../src/lib/SignalGenerator');
+
+// Initialize SignalGenerator before importing server to avoid path issues
+SignalGenerator.initialize(path.resolve(__dirname, '../signal-weights.js'));
+
+const { MarketDataManager } = require('../server');
+
+// KuCoin kline rows: [timestamp, open, high, low, close, volume] as strings
+function generateKlines(count, start = 60000) {
+  const rows = [];
+  let price = start;
+  for (let i = 0; i < count; i++) {
+    const open = price;
+    price += Math.sin(i / 3) * 40 + (i % 7) - 3;
+    rows.push([
+      1700000000000 + i * 60000,
+      String(open),
+      String(Math.max(open, price) + 10 + (i % 5)),
+      String(Math.min(open, price) - 10 - (i % 3)),
+      String(price),
+      String(100 + i)
+    ]);
+  }
+  return rows;
+}
+
+function makeCandle(i, close) {
+  return { timestamp: 1800000000000 + i * 60000, open: close, high: close + 5, low: close - 5, close, volume: 1 };
+}
+
+function assertColumnsMatchCandles(manager) {
+  const { candles, closes, highs, lows } = manager;
+  assert.strictEqual(closes.length, candles.length);
+  assert.strictEqual(highs.length, candles.length);
+  assert.strictEqual(lows.length, candles.length);
+  for (let i = 0; i < candles.length; i++) {
+    assert.strictEqual(closes[i], candles[i].close, `close mismatch at ${i}`);
+    assert.strictEqual(highs[i], candles[i].high, `high mismatch at ${i}`);
+    assert.strictEqual(lows[i], candles[i].low, `low mismatch at ${i}`);
+  }
+}
+
+// Indicators recomputed from scratch for the manager's current candles
+function fresh(manager) {
+  const copy = new MarketDataManager(manager.symbol);
+  for (const candle of manager.candles) copy.addCandle({ ...candle });
+  copy.currentPrice = manager.currentPrice;
+  return copy.getIndicators();
+}
+
+describe('MarketDataManager columns', () => {
+  test('columns track candles after rolling over at capacity', () => {
+    const manager = new MarketDataManager('XBTUSDTM');
+    manager.loadCandles(generateKlines(manager.maxCandles));
+
+    for (let i = 0; i < 25; i++) {
+      manager.addCandle(makeCandle(i, 61000 + i));
+    }
+
+    assert.strictEqual(manager.candles.length, manager.maxCandles);
+    assertColumnsMatchCandles(manager);
+    assert.strictEqual(manager.closes[manager.closes.length - 1], 61024);
+  });
+
+  test('columns grow past maxCandles for large loads and stay in sync on add', () => {
+    const manager = new MarketDataManager('XBTUSDTM');
+    manager.loadCandles(generateKlines(600));
+    assertColumnsMatchCandles(manager);
+    assert.strictEqual(manager.closes.length, 600);
+
+    manager.addCandle(makeCandle(0, 62000));
+    assertColumnsMatchCandles(manager);
+    assert.strictEqual(manager.closes[manager.closes.length - 1], 62000);
+  });
+});
+
+describe('MarketDataManager loadCandles ordering', () => {
+  test('sorts out-of-order klines by timestamp', () => {
+    const rows = generateKlines(80);
+    const shuffled = [...rows.slice(40), ...rows.slice(0, 40).reverse()];
+
+    const manager = new MarketDataManager('XBTUSDTM');
+    manager.loadCandles(shuffled);
+
+    assert.deepStrictEqual(manager.candles.map(c => c.timestamp), rows.map(r => r[0]));
+    assertColumnsMatchCandles(manager);
+    assert.strictEqual(manager.currentPrice, parseFloat(rows[rows.length - 1][4]));
+  });
+
+  test('keeps input order for duplicate timestamps', () => {
+    const rows = generateKlines(6);
+    const duplicate = [...rows[2]];
+    duplicate[0] = rows[4][0];
+    duplicate[4] = '12345';
+    // Out of order overall, with two rows sharing rows[4]'s timestamp
+    const input = [rows[4], rows[0], duplicate, rows[1], rows[3], rows[5]];
+
+    const manager = new MarketDataManager('XBTUSDTM');
+    manager.loadCandles(input);
+
+    assert.deepStrictEqual(
+      manager.candles.map(c => c.timestamp),
+      [rows[0][0], rows[1][0], rows[3][0], rows[4][0], rows[4][0], rows[5][0]]
+    );
+    // Stable sort: the row given first stays first among equal timestamps
+    assert.strictEqual(manager.candles[3].close, parseFloat(rows[4][4]));
+    assert.strictEqual(manager.candles[4].close, 12345);
+    assertColumnsMatchCandles(manager);
+  });
+});
+
+describe('MarketDataManager indicator cache', () => {
+  test('reuses candle indicators across ticker updates and refreshes price', () => {
+    const manager = new MarketDataManager('XBTUSDTM');
+    manager.loadCandles(generateKlines(120));
+
+    const before = manager.getIndicators();
+    const cache = manager.indicatorCache;
+    manager.updateTicker({ price: '65432.1' });
+    const after = manager.getIndicators();
+
+    assert.strictEqual(manager.indicatorCache, cache);
+    assert.strictEqual(after.price, 65432.1);
+    assert.notStrictEqual(after, before);
+    assert.deepStrictEqual({ ...after, price: before.price }, before);
+  });
+
+  test('addCandle invalidates cached indicators', () => {
+    const manager = new MarketDataManager('XBTUSDTM');
+    manager.loadCandles(generateKlines(120));
+
+    const before = manager.getIndicators();
+    manager.addCandle(makeCandle(0, 70000));
+    assert.strictEqual(manager.indicatorCache, null);
+
+    const after = manager.getIndicators();
+    assert.notStrictEqual(after.rsi, before.rsi);
+    assert.deepStrictEqual(after, fresh(manager));
+  });
+
+  test('loadCandles invalidates cached indicators', () => {
+    const manager = new MarketDataManager('XBTUSDTM');
+    manager.loadCandles(generateKlines(120));
+
+    const before = manager.getIndicators();
+    manager.loadCandles(generateKlines(120, 30000));
+    assert.strictEqual(manager.indicatorCache, null);
+
+    const after = manager.getIndicators();
+    assert.notStrictEqual(after.ema50, before.ema50);
+    assert.deepStrictEqual(after, fresh(manager));
+  });
+});
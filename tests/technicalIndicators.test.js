@@ -0,0 +1,91 @@
+process.env.DEMO_MODE = 'true';
+process.env.RUN_INTERVALS = 'false';
+
+const { test, describe } = require('node:test');
+const assert = require('node:assert');
+const path = require('path');
+const SignalGenerator = require('../src/lib/SignalGenerator');
+
+// Initialize SignalGenerator before importing server to avoid path issues
+SignalGenerator.initialize(path.resolve(__dirname, '../signal-weights.js'));
+
+const { TechnicalIndicators } = require('../server');
+
+// Deterministic price walk around a BTC-like level
+function generateSeries(count, start = 60000) {
+  const closes = [];
+  const highs = [];
+  const lows = [];
+  let price = start;
+  for (let i = 0; i < count; i++) {
+    price += Math.sin(i / 3) * 40 + (i % 7) - 3;
+    closes.push(price);
+    highs.push(price + 15 + (i % 5));
+    lows.push(price - 15 - (i % 3));
+  }
+  return { closes, highs, lows };
+}
+
+describe('TechnicalIndicators', () => {
+  test('dual EMA matches two separate EMA passes', () => {
+    const { closes } = generateSeries(120);
+    const { fast, slow } = TechnicalIndicators.calculateDualEMA(closes, 12, 26);
+
+    assert.strictEqual(fast, TechnicalIndicators.calculateEMA(closes, 12));
+    assert.strictEqual(slow, TechnicalIndicators.calculateEMA(closes, 26));
+  });
+
+  test('dual EMA returns null for periods longer than the series', () => {
+    const { closes } = generateSeries(20);
+    const { fast, slow } = TechnicalIndicators.calculateDualEMA(closes, 12, 26);
+
+    assert.strictEqual(fast, TechnicalIndicators.calculateEMA(closes, 12));
+    assert.strictEqual(slow, null);
+  });
+
+  test('high/low range covers only the trailing window', () => {
+    const highs = [500, 10, 12, 11];
+    const lows = [1, 8, 9, 7];
+    const range = TechnicalIndicators.calculateHighLow(highs, lows, 3);
+
+    assert.deepStrictEqual(range, { highestHigh: 12, lowestLow: 7 });
+  });
+
+  test('AO subtracts the long median-price SMA from the short one', () => {
+    const highs = [1000, 11, 12, 13, 14];
+    const lows = [0, 9, 10, 11, 12];
+
+    // Medians of the last 4 bars are 10, 11, 12, 13; short window is the last 2
+    assert.strictEqual(TechnicalIndicators.calculateAO(highs, lows, 2, 4), 12.5 - 11.5);
+  });
+
+  test('ATR averages true ranges of the trailing window', () => {
+    const highs = [10, 12, 13, 15];
+    const lows = [9, 10, 11, 12];
+    const closes = [9.5, 11, 12.5, 14];
+
+    // True ranges of the last two bars: max(2, 2, 0) and max(3, 2.5, 0.5)
+    assert.strictEqual(TechnicalIndicators.calculateATR(highs, lows, closes, 2), 2.5);
+  });
+
+  test('Bollinger Bands use the population standard deviation of the window', () => {
+    const data = [100, 2, 4, 4, 4, 5, 5, 7, 9];
+    const bands = TechnicalIndicators.calculateBollingerBands(data, 8, 2);
+
+    assert.strictEqual(bands.middle, 5);
+    assert.strictEqual(bands.upper, 9);
+    assert.strictEqual(bands.lower, 1);
+  });
+
+  test('Bollinger Bands stay close to the two-pass result at large price levels', () => {
+    const { closes } = generateSeries(60);
+    const window = closes.slice(-20);
+    const mean = window.reduce((sum, val) => sum + val, 0) / 20;
+    const std = Math.sqrt(window.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / 20);
+    const bands = TechnicalIndicators.calculateBollingerBands(closes, 20, 2);
+
+    assert.strictEqual(bands.middle, mean);
+    assert.ok(Math.abs(bands.upper - (mean + 2 * std)) < 1e-8);
+    assert.ok(Math.abs(bands.lower - (mean - 2 * std)) < 1e-8);
+  });
+});
@@ -0,0 +1,90 @@
+// ============================================================================
+// timeframeAligner Tests
+// ============================================================================
+
+const { test, describe } = require('node:test');
+const assert = require('node:assert');
+const { checkAlignment } = require('../timeframeAligner');
+
+const indicatorParams = {
+  rsi: { oversold: 30, overbought: 70 },
+  williamsR: { oversoldLevel: -80, overboughtLevel: -20 }
+};
+
+// Single-indicator config: one aligned indicator is enough for a signal
+function configFor(indicators, alignment = { strict: false, minAligned: 1 }) {
+  return { indicators, indicatorParams, alignment };
+}
+
+describe('checkAlignment', () => {
+  const cases = [
+    { ind: 'rsi', bullish: 25, bearish: 75, neutral: 50 },
+    { ind: 'macd', bullish: { histogram: 0.4 }, bearish: { histogram: -0.4 }, neutral: { histogram: 0 } },
+    { ind: 'williamsR', bullish: -90, bearish: -10, neutral: -50 },
+    { ind: 'ao', bullish: 12, bearish: -12, neutral: 0 }
+  ];
+
+  for (const { ind, bullish, bearish, neutral } of cases) {
+    test(`${ind} aligned bullish on both timeframes`, () => {
+      const result = checkAlignment({ [ind]: bullish }, { [ind]: bullish }, configFor([ind]));
+      assert.deepStrictEqual(result, { direction: 'bullish', indicators: [ind] });
+    });
+
+    test(`${ind} aligned bearish on both timeframes`, () => {
+      const result = checkAlignment({ [ind]: bearish }, { [ind]: bearish }, configFor([ind]));
+      assert.deepStrictEqual(result, { direction: 'bearish', indicators: [ind] });
+    });
+
+    test(`${ind} with disagreeing or neutral timeframes does not align`, () => {
+      assert.strictEqual(checkAlignment({ [ind]: bullish }, { [ind]: bearish }, configFor([ind])), null);
+      assert.strictEqual(checkAlignment({ [ind]: bullish }, { [ind]: neutral }, configFor([ind])), null);
+    });
+
+    test(`${ind} missing on one timeframe does not align`, () => {
+      assert.strictEqual(checkAlignment({ [ind]: bullish }, { [ind]: null }, configFor([ind])), null);
+      assert.strictEqual(checkAlignment({}, { [ind]: bearish }, configFor([ind])), null);
+    });
+  }
+
+  test('macd falls back to macd vs signal without a histogram', () => {
+    const up = { macd: 1.2, signal: 0.8 };
+    const down = { macd: 0.5, signal: 0.9 };
+    assert.strictEqual(checkAlignment({ macd: up }, { macd: up }, configFor(['macd'])).direction, 'bullish');
+    assert.strictEqual(checkAlignment({ macd: down }, { macd: down }, configFor(['macd'])).direction, 'bearish');
+  });
+
+  test('unknown indicators are skipped but still count toward strict mode', () => {
+    const values = { rsi: 20, foo: 1 };
+
+    const loose = checkAlignment(values, values, configFor(['rsi', 'foo']));
+    assert.deepStrictEqual(loose, { direction: 'bullish', indicators: ['rsi'] });
+
+    const strict = checkAlignment(values, values, configFor(['rsi', 'foo'], { strict: true }));
+    assert.strictEqual(strict, null);
+  });
+
+  test('overlapping thresholds mark a value both bullish and bearish', () => {
+    const config = {
+      indicators: ['rsi'],
+      indicatorParams: { rsi: { oversold: 70, overbought: 30 } },
+      alignment: { strict: false, minAligned: 1 }
+    };
+
+    // 50 is below oversold and above overbought: both directions qualify,
+    // so neither can win
+    assert.strictEqual(checkAlignment({ rsi: 50 }, { rsi: 50 }, config), null);
+    // Only the bullish side is shared across timeframes here
+    assert.deepStrictEqual(
+      checkAlignment({ rsi: 50 }, { rsi: 20 }, config),
+      { direction: 'bullish', indicators: ['rsi'] }
+    );
+  });
+
+  test('minAligned requires enough indicators in the same direction', () => {
+    const low = { rsi: 20, ao: 5, macd: { histogram: -1 } };
+    const high = { rsi: 25, ao: 3, macd: { histogram: -2 } };
+    const config = configFor(['rsi', 'ao', 'macd'], { strict: false, minAligned: 2 });
+
+    assert.deepStrictEqual(checkAlignment(low, high, config), { direction: 'bullish', indicators: ['rsi', 'ao'] });
+  });
+});
@@ -20,6 +20,15 @@ describe('TradeMath core formulas', () => {
     assert.strictEqual(positionValue, 500);
   });
 
+  test('floors contract size to whole lots', () => {
+    assert.strictEqual(TradeMath.calculateLotSize(5000, 100, 1), 50);
+    assert.strictEqual(TradeMath.calculateLotSize(5000, 100, 1, 20), 40);
+    assert.strictEqual(
+      TradeMath.calculateLotSize(5000, 100, 1, 20),
+      TradeMath.roundToLotSize(TradeMath.calculateLotSize(5000, 100, 1), 20)
+    );
+  });
+
   test('derives leveraged ROI from price change', () => {
     const priceDiff = TradeMath.calculatePriceDiff('long', 100, 102);
     const unrealized = TradeMath.calculateUnrealizedPnl(priceDiff, 2);
@@ -40,6 +49,17 @@ describe('TradeMath core formulas', () => {
     assert.strictEqual(tp, 100.2);
   });
 
+  test('bracket prices match the individual SL/TP helpers', () => {
+    for (const side of ['long', 'short']) {
+      const bracket = TradeMath.calculateBracketPrices(side, 100, 0.5, 2, 10, 1);
+      assert.strictEqual(bracket.stopLoss, TradeMath.calculateStopLossPrice(side, 100, 0.5, 10));
+      assert.strictEqual(bracket.takeProfit, TradeMath.calculateTakeProfitPrice(side, 100, 2, 10));
+      assert.strictEqual(bracket.tp1Price, TradeMath.calculateTakeProfitPrice(side, 100, 1, 10));
+    }
+
+    assert.strictEqual(TradeMath.calculateBracketPrices('long', 100, 0.5, 2, 10).tp1Price, null);
+  });
+
   test('calculates liquidation price with maintenance margin', () => {
     const liq = TradeMath.calculateLiquidationPrice('long', 10000, 10, 0.5);
     assert.strictEqual(Number(liq.toFixed(0)), 8995);
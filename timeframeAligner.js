@@ -5,50 +5,42 @@
  * for bullish or bearish signals according to the rules in config.
  */
 
-function isBullishRSI(rsi, params) {
-  if (rsi == null) return false;
-  const { oversold } = params.rsi || {};
-  return rsi < oversold;
+// Direction flags; a value can carry both if thresholds overlap
+const BULLISH = 1;
+const BEARISH = 2;
+
+function rsiDirection(rsi, params) {
+  if (rsi == null) return 0;
+  const { oversold, overbought } = params.rsi || {};
+  return (rsi < oversold ? BULLISH : 0) | (rsi > overbought ? BEARISH : 0);
 }
 
-function isBearishRSI(rsi, params) {
-  if (rsi == null) return false;
-  const { overbought } = params.rsi || {};
-  return rsi > overbought;
-}
-
-function isBullishMACD(macd, params) {
-  if (macd == null) return false;
+function macdDirection(macd, params) {
+  if (macd == null) return 0;
   // Using histogram if provided
-  return macd.histogram != null ? macd.histogram > 0 : macd.macd > macd.signal;
-}
-
-function isBearishMACD(macd, params) {
-  if (macd == null) return false;
-  return macd.histogram != null ? macd.histogram < 0 : macd.macd < macd.signal;
-}
-
-function isBullishWilliamsR(wr, params) {
-  if (wr == null) return false;
-  const { oversoldLevel } = params.williamsR || {};
-  return wr < oversoldLevel;
+  if (macd.histogram != null) {
+    return (macd.histogram > 0 ? BULLISH : 0) | (macd.histogram < 0 ? BEARISH : 0);
+  }
+  return (macd.macd > macd.signal ? BULLISH : 0) | (macd.macd < macd.signal ? BEARISH : 0);
 }
 
-function isBearishWilliamsR(wr, params) {
-  if (wr == null) return false;
-  const { overboughtLevel } = params.williamsR || {};
-  return wr > overboughtLevel;
+function williamsRDirection(wr, params) {
+  if (wr == null) return 0;
+  const { oversoldLevel, overboughtLevel } = params.williamsR || {};
+  return (wr < oversoldLevel ? BULLISH : 0) | (wr > overboughtLevel ? BEARISH : 0);
 }
 
-function isBullishAO(ao, params) {
-  if (ao == null) return false;
-  return ao > 0;
+function aoDirection(ao, params) {
+  if (ao == null) return 0;
+  return (ao > 0 ? BULLISH : 0) | (ao < 0 ? BEARISH : 0);
 }
 
-function isBearishAO(ao, params) {
-  if (ao == null) return false;
-  return ao < 0;
-}
+const DIRECTION_FNS = new Map([
+  ['rsi', rsiDirection],
+  ['macd', macdDirection],
+  ['williamsR', williamsRDirection],
+  ['ao', aoDirection]
+]);
 
 /**
  * Main check function
@@ -69,50 +61,19 @@ function checkAlignment(lowTfValues, highTfValues, config) {
 
   // Evaluate each configured indicator
   for (const ind of indicators) {
-    const lowVal = lowTfValues[ind];
-    const highVal = highTfValues[ind];
-
-    switch (ind) {
-      case 'rsi':
-        if (isBullishRSI(lowVal, indicatorParams) && isBullishRSI(highVal, indicatorParams)) {
-          results.bullish.push('rsi');
-        }
-        if (isBearishRSI(lowVal, indicatorParams) && isBearishRSI(highVal, indicatorParams)) {
-          results.bearish.push('rsi');
-        }
-        break;
-
-      case 'macd':
-        if (isBullishMACD(lowVal, indicatorParams) && isBullishMACD(highVal, indicatorParams)) {
-          results.bullish.push('macd');
-        }
-        if (isBearishMACD(lowVal, indicatorParams) && isBearishMACD(highVal, indicatorParams)) {
-          results.bearish.push('macd');
-        }
-        break;
-
-      case 'williamsR':
-        if (isBullishWilliamsR(lowVal, indicatorParams) && isBullishWilliamsR(highVal, indicatorParams)) {
-          results.bullish.push('williamsR');
-        }
-        if (isBearishWilliamsR(lowVal, indicatorParams) && isBearishWilliamsR(highVal, indicatorParams)) {
-          results.bearish.push('williamsR');
-        }
-        break;
-
-      case 'ao':
-        if (isBullishAO(lowVal, indicatorParams) && isBullishAO(highVal, indicatorParams)) {
-          results.bullish.push('ao');
-        }
-        if (isBearishAO(lowVal, indicatorParams) && isBearishAO(highVal, indicatorParams)) {
-          results.bearish.push('ao');
-        }
-        break;
-
-      default:
-        // Unknown indicator — skip or log
-        break;
+    const direction = DIRECTION_FNS.get(ind);
+    if (!direction) {
+      // Unknown indicator — skip or log
+      continue;
     }
+
+    // Both timeframes are classified once; the AND keeps only the
+    // directions they agree on, bullish and bearish together
+    const aligned = direction(lowTfValues[ind], indicatorParams) &
+      direction(highTfValues[ind], indicatorParams);
+
+    if (aligned & BULLISH) results.bullish.push(ind);
+    if (aligned & BEARISH) results.bearish.push(ind);
   }
 
   // Decide signal according to config rules: